@@ -19,9 +19,8 @@ logger = logging.getLogger(__name__)
 medication_processor = None
 qa_engine = None
 
-@app.before_first_request
 def initialize_data():
-    """Initialize data before the first request"""
+    """Load the dataset and build the processing engines"""
     global medication_processor, qa_engine
     
     try:
@@ -42,6 +41,10 @@ def initialize_data():
         logger.error(f"Error during initialization: {str(e)}")
         raise
 
+# Load eagerly at process start (before_first_request is deprecated in
+# Flask 2.3 and deferred the full parse cost onto the first request)
+initialize_data()
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint to verify the API is running"""
@@ -169,8 +172,16 @@ def get_statistics():
 if __name__ == '__main__':
     # Get port from environment variable or use default
     port = int(os.environ.get('PORT', 5000))
-    
-    # Run the app
-    app.run(debug=os.environ.get('FLASK_ENV') == 'development', 
-            host='0.0.0.0', 
-            port=port)
+
+    if os.environ.get('FLASK_ENV') == 'development':
+        app.run(debug=True, host='0.0.0.0', port=port)
+    else:
+        # All endpoints are read-only queries against data that is built once
+        # in initialize_data and never mutated, so they are safe to serve from
+        # multiple threads without locking
+        try:
+            from waitress import serve
+            serve(app, host='0.0.0.0', port=port, threads=8)
+        except ImportError:
+            logger.warning("waitress not installed; falling back to the threaded dev server")
+            app.run(host='0.0.0.0', port=port, threaded=True)
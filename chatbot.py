@@ -0,0 +1,133 @@
+import re
+from functools import lru_cache
+
+import pandas as pd
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+url = "https://hebbkx1anhila5yf.public.blob.vercel-storage.com/finaldatasets-EwfO5Xa82dxayNxObPBoz3Pzyujsvg.csv"
+
+# Populated by load_data(); importing this module stays side-effect free
+df = None
+SYMPTOM_INDEX = {}
+
+# Symptoms that need immediate medical attention
+emergency_symptoms = [
+    'chest pain', 'difficulty breathing', 'severe bleeding', 'unconscious',
+    'seizure', 'stroke', 'heart attack', 'severe allergic reaction', 'overdose'
+]
+
+# Common symptoms the chatbot can suggest medications for
+simple_symptoms = [
+    'headache', 'fever', 'cough', 'sore throat', 'runny nose', 'sneezing',
+    'nausea', 'vomiting', 'diarrhea', 'constipation', 'heartburn',
+    'muscle pain', 'allergy'
+]
+
+all_symptoms = emergency_symptoms + simple_symptoms
+
+# Set views used to classify scan hits without looping symptom lists
+EMERGENCY_SET = frozenset(emergency_symptoms)
+SIMPLE_ORDER = {symptom: rank for rank, symptom in enumerate(simple_symptoms)}
+
+# Build a single multi-pattern matcher over all symptoms so each piece of text
+# is scanned once instead of once per symptom. pyahocorasick gives a true
+# multi-pattern automaton; a compiled alternation regex is the fallback.
+if ahocorasick is not None:
+    symptom_automaton = ahocorasick.Automaton()
+    for symptom in all_symptoms:
+        symptom_automaton.add_word(symptom, symptom)
+    symptom_automaton.make_automaton()
+    symptom_regex = None
+else:
+    symptom_automaton = None
+    symptom_regex = re.compile(
+        '|'.join(re.escape(s) for s in sorted(all_symptoms, key=len, reverse=True))
+    )
+
+
+def find_symptoms(text):
+    """Find all known symptoms mentioned in the text with a single scan"""
+    if symptom_automaton is not None:
+        return {symptom for _, symptom in symptom_automaton.iter(text)}
+    return set(symptom_regex.findall(text))
+
+
+def _build_symptom_index():
+    """Map each symptom to the first few matching medication records
+
+    All DataFrame work happens here, once at load time; answering a query
+    only needs a dict lookup and string formatting.
+    """
+    symptom_to_rows = {symptom: [] for symptom in simple_symptoms}
+    for pos, indication in enumerate(df['Indications_for_Use_lc'].to_numpy()):
+        for symptom in find_symptoms(indication):
+            if symptom in symptom_to_rows:
+                symptom_to_rows[symptom].append(pos)
+
+    return {
+        symptom: df.iloc[rows[:3]][['Trade_Name', 'Indications_for_Use']].to_dict('records')
+        for symptom, rows in symptom_to_rows.items()
+    }
+
+
+def load_data(source=url):
+    """Load the dataset and build the symptom index"""
+    global df, SYMPTOM_INDEX
+
+    df = pd.read_csv(source)
+
+    # Keep the original casing for display and precompute a lowercase shadow
+    # column once for case-insensitive matching; fill missing indications
+    # first (astype(str) leaves NA values as-is on current pandas, and
+    # find_symptoms chokes on non-string rows)
+    df['Indications_for_Use_lc'] = (
+        df['Indications_for_Use'].fillna('').astype(str).str.lower()
+    )
+
+    SYMPTOM_INDEX = _build_symptom_index()
+    _respond.cache_clear()
+
+
+def chatbot_response(user_input):
+    """Generate a chatbot response for the user's message"""
+    if df is None:
+        load_data()
+    return _respond(user_input.lower().strip())
+
+
+@lru_cache(maxsize=1024)
+def _respond(user_input):
+    """Compute the response for normalized input (memoized for repeats)"""
+    found = find_symptoms(user_input)
+
+    # Emergency symptoms take priority over any suggestion
+    if found & EMERGENCY_SET:
+        return ("Your symptoms may be serious. Please seek immediate medical "
+                "attention or call emergency services.")
+
+    for symptom in sorted(found & SIMPLE_ORDER.keys(), key=SIMPLE_ORDER.get):
+        matches = SYMPTOM_INDEX[symptom]
+        if matches:
+            response = f"For {symptom}, you could consider:\n"
+            for record in matches:
+                response += f"- {record['Trade_Name']}: {record['Indications_for_Use']}\n"
+            response += "\nPlease consult a pharmacist or doctor before taking any medication."
+            return response
+
+    return ("I'm sorry, I couldn't identify your symptoms. Could you describe "
+            "them differently, or consult a pharmacist for advice?")
+
+
+if __name__ == "__main__":
+    load_data()
+    print("Virtual Pharmacist Chatbot (type 'quit' to exit)")
+    while True:
+        user_input = input("You: ")
+        if user_input.lower() in ('quit', 'exit', 'bye'):
+            print("Bot: Take care! Goodbye.")
+            break
+        print(f"Bot: {chatbot_response(user_input)}")
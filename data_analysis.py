@@ -1,17 +1,68 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
-from collections import Counter
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _minmaxmean(arr):
+        """Fused single-pass min/max/mean over a dense float array"""
+        mn = arr[0]
+        mx = arr[0]
+        total = 0.0
+        for value in arr:
+            if value < mn:
+                mn = value
+            if value > mx:
+                mx = value
+            total += value
+        return total / len(arr), mn, mx
+
+
+def price_statistics(prices):
+    """
+    Compute mean/median/min/max of a price Series in as few passes as possible
+
+    Numba (when installed) fuses min/max/mean into one compiled loop; the
+    median uses a partial sort via np.partition instead of a full sort.
+    """
+    arr = prices.dropna().to_numpy(dtype=np.float32)
+    if arr.size == 0:
+        return {'mean': float('nan'), 'median': float('nan'),
+                'min': float('nan'), 'max': float('nan')}
+
+    if njit is not None:
+        mean, mn, mx = _minmaxmean(arr)
+    else:
+        mean, mn, mx = arr.mean(), arr.min(), arr.max()
+
+    mid = arr.size // 2
+    part = np.partition(arr, mid)
+    if arr.size % 2:
+        median = part[mid]
+    else:
+        median = (part[mid] + part[:mid].max()) / 2
+
+    return {'mean': float(mean), 'median': float(median),
+            'min': float(mn), 'max': float(mx)}
+
+
 def analyze_medication_data():
     """
     Analyze the medication dataset and generate insights
     """
     try:
-        # Load the dataset
+        # Load the dataset with an explicit schema: only the columns the
+        # analysis uses, with low-cardinality columns parsed as categoricals
         url = "https://hebbkx1anhila5yf.public.blob.vercel-storage.com/finaldatasets-EwfO5Xa82dxayNxObPBoz3Pzyujsvg.csv"
-        df = pd.read_csv(url)
+        usecols = ['Category', 'Price', 'Local/Import'] + [f'Side_Effect_{i}' for i in range(1, 10)]
+        df = pd.read_csv(url, usecols=usecols,
+                         dtype={'Category': 'category', 'Local/Import': 'category'})
         print(f"Successfully loaded dataset with {len(df)} medications")
         
         # Basic dataset information
@@ -28,30 +79,33 @@ def analyze_medication_data():
         
         # Price analysis
         print("\n=== Price Analysis ===")
-        # Convert price to numeric, handling any non-numeric values
-        df['Price_Numeric'] = pd.to_numeric(df['Price'], errors='coerce')
-        print(f"Average price: {df['Price_Numeric'].mean():.2f}")
-        print(f"Median price: {df['Price_Numeric'].median():.2f}")
-        print(f"Min price: {df['Price_Numeric'].min():.2f}")
-        print(f"Max price: {df['Price_Numeric'].max():.2f}")
+        # Convert price to numeric, handling any non-numeric values; downcast
+        # halves the column's memory (float64 -> float32)
+        df['Price_Numeric'] = pd.to_numeric(df['Price'], errors='coerce', downcast='float')
+        price_stats = price_statistics(df['Price_Numeric'])
+        print(f"Average price: {price_stats['mean']:.2f}")
+        print(f"Median price: {price_stats['median']:.2f}")
+        print(f"Min price: {price_stats['min']:.2f}")
+        print(f"Max price: {price_stats['max']:.2f}")
         
         # Side effects analysis
         print("\n=== Side Effects Analysis ===")
         # Count medications with side effects
-        side_effects_columns = [col for col in df.columns if col.startswith('Side_Effect_')]
+        side_effects_columns = df.columns[df.columns.str.startswith('Side_Effect_')]
         has_side_effects = df[side_effects_columns].notna().any(axis=1).sum()
         print(f"Medications with at least one side effect: {has_side_effects} ({has_side_effects/len(df)*100:.1f}%)")
-        
-        # Collect all side effects
-        all_side_effects = []
-        for col in side_effects_columns:
-            all_side_effects.extend(df[col].dropna().tolist())
-        
-        # Count frequency of each side effect
-        side_effect_counts = Counter(all_side_effects)
+
+        # Count frequency of each side effect in one vectorized pass; the
+        # top 10 come from a partial selection instead of a full sort
+        se_array = df[side_effects_columns].stack().to_numpy()
+        effects, counts = np.unique(se_array, return_counts=True)
+        top = min(10, len(counts))
         print("\nTop 10 most common side effects:")
-        for effect, count in side_effect_counts.most_common(10):
-            print(f"- {effect}: {count} occurrences")
+        if top:
+            top_idx = np.argpartition(-counts, top - 1)[:top]
+            top_idx = top_idx[np.argsort(-counts[top_idx])]
+            for effect, count in zip(effects[top_idx], counts[top_idx]):
+                print(f"- {effect}: {count} occurrences")
         
         # Local vs Import analysis
         print("\n=== Local vs Import Analysis ===")
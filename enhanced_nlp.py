@@ -1,183 +1,241 @@
-import re
-import string
-from collections import Counter
-
-class MedicationNLP:
-    """
-    Enhanced NLP capabilities for the Virtual Pharmacist
-    """
-    
-    def __init__(self, medications_df):
-        self.medications_df = medications_df
-        self.medication_names = set()
-        self.generic_names = set()
-        self.categories = set()
-        self.common_words = set(['what', 'is', 'are', 'the', 'for', 'of', 'and', 'to', 'in', 'with', 'can', 'i', 'my', 'me', 'about', 'tell'])
-        self._initialize_data()
-    
-    def _initialize_data(self):
-        """Initialize data structures for faster lookups"""
-        if self.medications_df is not None and not self.medications_df.empty:
-            # Extract all medication names (lowercase for case-insensitive matching)
-            self.medication_names = {name.lower() for name in self.medications_df['Trade_Name'].dropna()}
-            
-            # Extract all generic names
-            self.generic_names = {name.lower() for name in self.medications_df['Generic_Name'].dropna()}
-            
-            # Extract all categories
-            self.categories = {cat.lower() for cat in self.medications_df['Category'].dropna()}
-    
-    def preprocess_text(self, text):
-        """Clean and preprocess text"""
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove punctuation
-        text = text.translate(str.maketrans('', '', string.punctuation))
-        
-        return text
-    
-    def extract_keywords(self, text):
-        """Extract important keywords from the text"""
-        # Preprocess the text
-        processed_text = self.preprocess_text(text)
-        
-        # Split into words
-        words = processed_text.split()
-        
-        # Remove common words
-        keywords = [word for word in words if word not in self.common_words]
-        
-        return keywords
-    
-    def identify_medication_names(self, text):
-        """Identify medication names mentioned in the text"""
-        processed_text = self.preprocess_text(text)
-        
-        found_medications = []
-        
-        # Check for exact medication names
-        for med_name in self.medication_names:
-            if med_name in processed_text:
-                # Find the original medication name with proper capitalization
-                original_name = next((name for name in self.medications_df['Trade_Name'] 
-                                     if name.lower() == med_name), med_name)
-                found_medications.append(original_name)
-        
-        # Check for generic names
-        for gen_name in self.generic_names:
-            if gen_name in processed_text:
-                # Find medications with this generic name
-                matching_meds = self.medications_df[
-                    self.medications_df['Generic_Name'].str.lower() == gen_name
-                ]['Trade_Name'].tolist()
-                found_medications.extend(matching_meds)
-        
-        return list(set(found_medications))  # Remove duplicates
-    
-    def identify_intent(self, text):
-        """Identify the user's intent from the question"""
-        processed_text = self.preprocess_text(text)
-        
-        # Define intent patterns
-        intent_patterns = {
-            'side_effects': ['side effect', 'adverse', 'reaction', 'negative', 'bad'],
-            'price': ['price', 'cost', 'how much', 'expensive', 'cheap'],
-            'usage': ['use', 'treat', 'for', 'indication', 'what is', 'what\'s', 'help with'],
-            'dosage': ['dose', 'dosage', 'how much', 'how many', 'take', 'frequency'],
-            'category': ['category', 'type', 'class', 'group', 'similar to'],
-            'comparison': ['compare', 'versus', 'vs', 'difference', 'better', 'worse'],
-            'availability': ['available', 'find', 'get', 'buy', 'purchase'],
-            'storage': ['store', 'keep', 'refrigerate', 'temperature']
-        }
-        
-        # Check for each intent
-        matched_intents = {}
-        for intent, patterns in intent_patterns.items():
-            for pattern in patterns:
-                if pattern in processed_text:
-                    if intent in matched_intents:
-                        matched_intents[intent] += 1
-                    else:
-                        matched_intents[intent] = 1
-        
-        # Return the intent with the most matches, or None if no matches
-        if matched_intents:
-            return max(matched_intents.items(), key=lambda x: x[1])[0]
-        return 'general_info'  # Default intent
-    
-    def identify_category_query(self, text):
-        """Identify if the user is asking about medications for a specific condition"""
-        processed_text = self.preprocess_text(text)
-        
-        # Check for patterns like "medications for X"
-        patterns = [
-            r'medications? for ([\w\s]+)',
-            r'drugs? for ([\w\s]+)',
-            r'medicine for ([\w\s]+)',
-            r'treatment for ([\w\s]+)',
-            r'cure for ([\w\s]+)',
-            r'remedy for ([\w\s]+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, processed_text)
-            if match:
-                condition = match.group(1).strip()
-                return condition
-        
-        return None
-    
-    def analyze_question(self, question):
-        """
-        Analyze a user question and extract structured information
-        
-        Returns:
-            dict: Contains extracted information including:
-                - medications: List of medication names mentioned
-                - intent: The primary intent of the question
-                - condition: Condition being asked about (if applicable)
-                - keywords: Important keywords from the question
-        """
-        result = {
-            'medications': self.identify_medication_names(question),
-            'intent': self.identify_intent(question),
-            'condition': self.identify_category_query(question),
-            'keywords': self.extract_keywords(question)
-        }
-        
-        return result
-
-# Example usage (if run directly)
-if __name__ == "__main__":
-    import pandas as pd
-    
-    # Load the dataset
-    try:
-        url = "https://hebbkx1anhila5yf.public.blob.vercel-storage.com/finaldatasets-EwfO5Xa82dxayNxObPBoz3Pzyujsvg.csv"
-        df = pd.read_csv(url)
-        
-        # Initialize the NLP processor
-        nlp = MedicationNLP(df)
-        
-        # Test with some example questions
-        test_questions = [
-            "What are the side effects of Panadol?",
-            "How much does Lipitor cost?",
-            "What is Zyrtec used for?",
-            "Can you tell me about medications for allergies?",
-            "What's the difference between generic and brand medications?",
-            "How should I store my antibiotics?"
-        ]
-        
-        print("Testing NLP analysis with example questions:")
-        for question in test_questions:
-            analysis = nlp.analyze_question(question)
-            print(f"\nQuestion: {question}")
-            print(f"Medications mentioned: {analysis['medications']}")
-            print(f"Intent: {analysis['intent']}")
-            print(f"Condition: {analysis['condition']}")
-            print(f"Keywords: {analysis['keywords']}")
-    
-    except Exception as e:
-        print(f"Error: {e}")
+import re
+import string
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+class MedicationNLP:
+    """
+    Enhanced NLP capabilities for the Virtual Pharmacist
+    """
+
+    # Translation table for stripping punctuation, built once
+    _PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+
+    # Stopwords filtered out of keyword extraction; frozenset membership
+    # checks are the fastest CPython has to offer
+    COMMON_WORDS = frozenset({
+        'what', 'is', 'are', 'the', 'for', 'of', 'and', 'to', 'in', 'with',
+        'can', 'i', 'my', 'me', 'about', 'tell'
+    })
+
+    def __init__(self, medications_df):
+        self.medications_df = medications_df
+        self.medication_names = set()
+        self.generic_names = set()
+        self.categories = set()
+        self._name_automaton = None
+        self._name_regex = None
+        self._name_kinds = {}
+        self._trade_lower_to_original = {}
+        self._generic_to_trades = {}
+
+        # Define intent patterns
+        self.intent_patterns = {
+            'side_effects': ['side effect', 'adverse', 'reaction', 'negative', 'bad'],
+            'price': ['price', 'cost', 'how much', 'expensive', 'cheap'],
+            'usage': ['use', 'treat', 'for', 'indication', 'what is', 'what\'s', 'help with'],
+            'dosage': ['dose', 'dosage', 'how much', 'how many', 'take', 'frequency'],
+            'category': ['category', 'type', 'class', 'group', 'similar to'],
+            'comparison': ['compare', 'versus', 'vs', 'difference', 'better', 'worse'],
+            'availability': ['available', 'find', 'get', 'buy', 'purchase'],
+            'storage': ['store', 'keep', 'refrigerate', 'temperature']
+        }
+
+        # Compile each intent's keywords into one alternation, counted
+        # independently per intent: a keyword shared by two intents (like
+        # 'how much') must credit both, which a single master alternation
+        # cannot do
+        self._intent_regex = {
+            intent: re.compile('|'.join(re.escape(pattern) for pattern in patterns))
+            for intent, patterns in self.intent_patterns.items()
+        }
+
+        # One compiled pattern for "medications for X"-style condition queries
+        self._condition_regex = re.compile(
+            r'(?:medications?|drugs?|medicine|treatment|cure|remedy)\s+for\s+([\w\s]+)'
+        )
+
+        self._initialize_data()
+    
+    def _initialize_data(self):
+        """Initialize data structures for faster lookups"""
+        if self.medications_df is not None and not self.medications_df.empty:
+            # Extract all medication names (lowercase for case-insensitive matching)
+            self.medication_names = {name.lower() for name in self.medications_df['Trade_Name'].dropna()}
+            
+            # Extract all generic names
+            self.generic_names = {name.lower() for name in self.medications_df['Generic_Name'].dropna()}
+            
+            # Extract all categories
+            self.categories = {cat.lower() for cat in self.medications_df['Category'].dropna()}
+
+            # Map lowercase names back to their original forms so matches
+            # don't need to re-scan the DataFrame
+            self._trade_lower_to_original = {
+                name.lower(): name for name in self.medications_df['Trade_Name'].dropna()
+            }
+            self._generic_to_trades = (
+                self.medications_df.dropna(subset=['Generic_Name'])
+                .groupby(self.medications_df['Generic_Name'].str.lower())['Trade_Name']
+                .apply(list)
+                .to_dict()
+            )
+
+            # Build a single multi-pattern matcher over all medication names so
+            # each question is scanned once instead of once per known name
+            names = [(name, 'trade') for name in self.medication_names]
+            names += [(name, 'generic') for name in self.generic_names]
+
+            if ahocorasick is not None:
+                self._name_automaton = ahocorasick.Automaton()
+                for name, kind in names:
+                    self._name_automaton.add_word(name, (name, kind))
+                self._name_automaton.make_automaton()
+                self._name_regex = None
+            else:
+                self._name_automaton = None
+                self._name_kinds = dict(names)
+                self._name_regex = re.compile(
+                    '|'.join(re.escape(name) for name, _ in
+                             sorted(names, key=lambda item: len(item[0]), reverse=True))
+                ) if names else None
+
+    def _scan_names(self, processed_text):
+        """Find all known medication names in the text with a single scan"""
+        if self._name_automaton is not None:
+            return {match for _, match in self._name_automaton.iter(processed_text)}
+        if self._name_regex is None:
+            return set()
+        return {(name, self._name_kinds[name])
+                for name in self._name_regex.findall(processed_text)}
+    
+    def preprocess_text(self, text):
+        """Clean and preprocess text"""
+        # Convert to lowercase
+        text = text.lower()
+        
+        # Remove punctuation
+        text = text.translate(self._PUNCT_TABLE)
+        
+        return text
+    
+    def extract_keywords(self, text):
+        """Extract important keywords from the text"""
+        return self._extract_keywords(self.preprocess_text(text))
+
+    def _extract_keywords(self, processed_text):
+        """Extract important keywords from already preprocessed text"""
+        # Split into words and drop common words in one pass
+        return [word for word in processed_text.split()
+                if word not in self.COMMON_WORDS]
+    
+    def identify_medication_names(self, text):
+        """Identify medication names mentioned in the text"""
+        return self._identify_medication_names(self.preprocess_text(text))
+
+    def _identify_medication_names(self, processed_text):
+        """Identify medication names in already preprocessed text"""
+        found_medications = []
+
+        # Find all trade and generic names in a single pass over the text
+        for med_name, kind in self._scan_names(processed_text):
+            if kind == 'trade':
+                # Recover the original capitalization from the precomputed map
+                found_medications.append(
+                    self._trade_lower_to_original.get(med_name, med_name))
+            else:
+                # Look up medications with this generic name
+                found_medications.extend(self._generic_to_trades.get(med_name, []))
+        
+        return list(set(found_medications))  # Remove duplicates
+    
+    def identify_intent(self, text):
+        """Identify the user's intent from the question"""
+        return self._identify_intent(self.preprocess_text(text))
+
+    def _identify_intent(self, processed_text):
+        """Identify the user's intent from already preprocessed text"""
+        # Count keyword hits per intent with its precompiled alternation
+        matched_intents = {}
+        for intent, regex in self._intent_regex.items():
+            hits = len(regex.findall(processed_text))
+            if hits:
+                matched_intents[intent] = hits
+
+        # Return the intent with the most matches, or None if no matches
+        if matched_intents:
+            return max(matched_intents.items(), key=lambda x: x[1])[0]
+        return 'general_info'  # Default intent
+    
+    def identify_category_query(self, text):
+        """Identify if the user is asking about medications for a specific condition"""
+        return self._identify_category_query(self.preprocess_text(text))
+
+    def _identify_category_query(self, processed_text):
+        """Identify a condition query in already preprocessed text"""
+        # Check for patterns like "medications for X" with a single search
+        match = self._condition_regex.search(processed_text)
+        if match:
+            return match.group(1).strip()
+
+        return None
+    
+    def analyze_question(self, question):
+        """
+        Analyze a user question and extract structured information
+        
+        Returns:
+            dict: Contains extracted information including:
+                - medications: List of medication names mentioned
+                - intent: The primary intent of the question
+                - condition: Condition being asked about (if applicable)
+                - keywords: Important keywords from the question
+        """
+        # Preprocess the question once and share it across all analyzers
+        processed_text = self.preprocess_text(question)
+
+        result = {
+            'medications': self._identify_medication_names(processed_text),
+            'intent': self._identify_intent(processed_text),
+            'condition': self._identify_category_query(processed_text),
+            'keywords': self._extract_keywords(processed_text)
+        }
+        
+        return result
+
+# Example usage (if run directly)
+if __name__ == "__main__":
+    import pandas as pd
+    
+    # Load the dataset
+    try:
+        url = "https://hebbkx1anhila5yf.public.blob.vercel-storage.com/finaldatasets-EwfO5Xa82dxayNxObPBoz3Pzyujsvg.csv"
+        df = pd.read_csv(url)
+        
+        # Initialize the NLP processor
+        nlp = MedicationNLP(df)
+        
+        # Test with some example questions
+        test_questions = [
+            "What are the side effects of Panadol?",
+            "How much does Lipitor cost?",
+            "What is Zyrtec used for?",
+            "Can you tell me about medications for allergies?",
+            "What's the difference between generic and brand medications?",
+            "How should I store my antibiotics?"
+        ]
+        
+        print("Testing NLP analysis with example questions:")
+        for question in test_questions:
+            analysis = nlp.analyze_question(question)
+            print(f"\nQuestion: {question}")
+            print(f"Medications mentioned: {analysis['medications']}")
+            print(f"Intent: {analysis['intent']}")
+            print(f"Condition: {analysis['condition']}")
+            print(f"Keywords: {analysis['keywords']}")
+    
+    except Exception as e:
+        print(f"Error: {e}")
@@ -0,0 +1,27 @@
+"""gunicorn configuration for the sample API
+
+The default sync worker closes every connection after one request (no
+keep-alive), so load generators and busy clients pile up sockets in
+TIME_WAIT and throughput hits a ceiling well below what the hardware
+allows. gevent workers keep connections open and multiplex them on green
+threads; all endpoints only read module-level data that is immutable
+after load_sample_data, so they are safe under greenlet concurrency.
+
+gunicorn picks this file up automatically:
+
+    gunicorn wsgi:app
+"""
+import multiprocessing
+
+bind = '0.0.0.0:5000'
+workers = multiprocessing.cpu_count() * 2 + 1
+
+try:
+    import gevent  # noqa: F401
+    worker_class = 'gevent'
+    worker_connections = 1000
+except ImportError:
+    # Threaded workers also support keep-alive, just with heavier threads
+    worker_class = 'gthread'
+    threads = 8
+keepalive = 5
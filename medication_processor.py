@@ -1,309 +1,528 @@
-import pandas as pd
-import numpy as np
-import logging
-from typing import List, Dict, Any, Optional, Union
-import re
-
-logger = logging.getLogger(__name__)
-
-class MedicationProcessor:
-    """
-    Class for processing and managing medication data
-    """
-    
-    def __init__(self):
-        """Initialize the MedicationProcessor"""
-        self.df = None
-        self.medications_dict = {}
-        self.categories = []
-        self.trade_name_index = {}
-        self.generic_name_index = {}
-        self.category_index = {}
-        
-    def load_data(self, source: str) -> bool:
-        """
-        Load medication data from a CSV file or URL
-        
-        Args:
-            source: Path or URL to the CSV file
-            
-        Returns:
-            bool: True if data was loaded successfully, False otherwise
-        """
-        try:
-            logger.info(f"Loading medication data from {source}")
-            self.df = pd.read_csv(source)
-            
-            # Clean the data
-            self._clean_data()
-            
-            # Create indexes for faster lookups
-            self._create_indexes()
-            
-            # Create a dictionary of medications for faster access
-            self._create_medications_dict()
-            
-            logger.info(f"Successfully loaded {len(self.df)} medications")
-            return True
-        except Exception as e:
-            logger.error(f"Error loading medication data: {str(e)}")
-            return False
-    
-    def _clean_data(self) -> None:
-        """Clean and preprocess the data"""
-        # Fill NaN values
-        self.df = self.df.fillna('')
-        
-        # Clean column names (remove whitespace)
-        self.df.columns = [col.strip() for col in self.df.columns]
-        
-        # Ensure required columns exist
-        required_columns = ['SN.', 'Trade_Name', 'Generic_Name', 'Category', 'Price']
-        for col in required_columns:
-            if col not in self.df.columns:
-                logger.warning(f"Required column '{col}' not found in dataset")
-        
-        # Convert price to numeric where possible
-        if 'Price' in self.df.columns:
-            self.df['Price_Numeric'] = pd.to_numeric(self.df['Price'], errors='coerce')
-    
-    def _create_indexes(self) -> None:
-        """Create indexes for faster lookups"""
-        # Extract categories
-        if 'Category' in self.df.columns:
-            self.categories = sorted(self.df['Category'].dropna().unique().tolist())
-            
-            # Create category index
-            for category in self.categories:
-                self.category_index[category.lower()] = category
-        
-        # Create trade name index
-        if 'Trade_Name' in self.df.columns:
-            for idx, name in enumerate(self.df['Trade_Name']):
-                if pd.notna(name) and name:
-                    self.trade_name_index[name.lower()] = idx
-        
-        # Create generic name index
-        if 'Generic_Name' in self.df.columns:
-            for idx, name in enumerate(self.df['Generic_Name']):
-                if pd.notna(name) and name:
-                    self.generic_name_index[name.lower()] = idx
-    
-    def _create_medications_dict(self) -> None:
-        """Create a dictionary of medications for faster access"""
-        for idx, row in self.df.iterrows():
-            # Extract side effects
-            side_effects = []
-            for i in range(1, 10):
-                effect_col = f'Side_Effect_{i}'
-                if effect_col in row and row[effect_col] and pd.notna(row[effect_col]):
-                    side_effects.append(row[effect_col])
-            
-            # Create medication object
-            medication = {
-                'id': str(idx),
-                'SN': row.get('SN.', ''),
-                'Trade_Name': row.get('Trade_Name', ''),
-                'Strength': row.get('Strenght/\nConc.', ''),
-                'Dosage_Form': row.get('Dosage_Form', ''),
-                'Quantity_of_Dosage_Form': row.get('Quantity_of_Dosage_Form', ''),
-                'Price': row.get('Price', ''),
-                'Generic_Name': row.get('Generic_Name', ''),
-                'Local_Import': row.get('Local/Import', ''),
-                'Category': row.get('Category', ''),
-                'Indications_for_Use': row.get('Indications_for_Use', ''),
-                'Side_Effects': side_effects,
-                'Image_URL': row.get('Image_URL', '')
-            }
-            
-            self.medications_dict[str(idx)] = medication
-    
-    def is_data_loaded(self) -> bool:
-        """Check if data is loaded"""
-        return self.df is not None and not self.df.empty
-    
-    def get_medication_count(self) -> int:
-        """Get the number of medications"""
-        return len(self.df) if self.df is not None else 0
-    
-    def get_categories(self) -> List[str]:
-        """Get all medication categories"""
-        return self.categories
-    
-    def get_medications(self, search: str = '', category: str = '', limit: Optional[int] = None) -> List[Dict[str, Any]]:
-        """
-        Get medications, optionally filtered by search term or category
-        
-        Args:
-            search: Search term to filter medications
-            category: Category to filter medications
-            limit: Maximum number of medications to return
-            
-        Returns:
-            List of medication dictionaries
-        """
-        results = []
-        
-        # If no filters, return all medications (up to limit)
-        if not search and not category:
-            results = list(self.medications_dict.values())
-            if limit:
-                results = results[:limit]
-            return results
-        
-        # Filter by category
-        if category:
-            if self.df is not None:
-                category_filter = self.df['Category'] == category
-                filtered_df = self.df[category_filter]
-                
-                for idx in filtered_df.index:
-                    if str(idx) in self.medications_dict:
-                        results.append(self.medications_dict[str(idx)])
-        else:
-            # Start with all medications
-            results = list(self.medications_dict.values())
-        
-        # Filter by search term
-        if search:
-            search = search.lower()
-            filtered_results = []
-            
-            for med in results:
-                if (search in med['Trade_Name'].lower() or
-                    search in med['Generic_Name'].lower() or
-                    search in med['Category'].lower() or
-                    search in med['Indications_for_Use'].lower()):
-                    filtered_results.append(med)
-            
-            results = filtered_results
-        
-        # Apply limit
-        if limit and len(results) > limit:
-            results = results[:limit]
-        
-        return results
-    
-    def get_medication_by_id(self, medication_id: str) -> Optional[Dict[str, Any]]:
-        """
-        Get a medication by its ID
-        
-        Args:
-            medication_id: ID of the medication
-            
-        Returns:
-            Medication dictionary or None if not found
-        """
-        return self.medications_dict.get(medication_id)
-    
-    def get_medication_by_name(self, name: str) -> Optional[Dict[str, Any]]:
-        """
-        Get a medication by its trade name or generic name
-        
-        Args:
-            name: Trade name or generic name of the medication
-            
-        Returns:
-            Medication dictionary or None if not found
-        """
-        name_lower = name.lower()
-        
-        # Check trade name index
-        if name_lower in self.trade_name_index:
-            idx = self.trade_name_index[name_lower]
-            return self.medications_dict.get(str(idx))
-        
-        # Check generic name index
-        if name_lower in self.generic_name_index:
-            idx = self.generic_name_index[name_lower]
-            return self.medications_dict.get(str(idx))
-        
-        return None
-    
-    def advanced_search(self, criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """
-        Perform an advanced search on medications
-        
-        Args:
-            criteria: Dictionary of search criteria
-            
-        Returns:
-            List of medication dictionaries matching the criteria
-        """
-        if self.df is None:
-            return []
-        
-        query_df = self.df.copy()
-        
-        # Apply filters based on criteria
-        if 'trade_name' in criteria and criteria['trade_name']:
-            query_df = query_df[query_df['Trade_Name'].str.contains(criteria['trade_name'], case=False, na=False)]
-        
-        if 'generic_name' in criteria and criteria['generic_name']:
-            query_df = query_df[query_df['Generic_Name'].str.contains(criteria['generic_name'], case=False, na=False)]
-        
-        if 'category' in criteria and criteria['category']:
-            query_df = query_df[query_df['Category'] == criteria['category']]
-        
-        if 'min_price' in criteria and criteria['min_price'] is not None:
-            query_df = query_df[query_df['Price_Numeric'] >= criteria['min_price']]
-        
-        if 'max_price' in criteria and criteria['max_price'] is not None:
-            query_df = query_df[query_df['Price_Numeric'] <= criteria['max_price']]
-        
-        if 'indication' in criteria and criteria['indication']:
-            query_df = query_df[query_df['Indications_for_Use'].str.contains(criteria['indication'], case=False, na=False)]
-        
-        # Convert results to list of dictionaries
-        results = []
-        for idx in query_df.index:
-            if str(idx) in self.medications_dict:
-                results.append(self.medications_dict[str(idx)])
-        
-        return results
-    
-    def get_statistics(self) -> Dict[str, Any]:
-        """
-        Get statistics about the medication dataset
-        
-        Returns:
-            Dictionary of statistics
-        """
-        if self.df is None:
-            return {}
-        
-        stats = {
-            'total_medications': len(self.df),
-            'total_categories': len(self.categories),
-            'price_statistics': {},
-            'categories_distribution': {},
-            'dosage_forms_distribution': {},
-            'local_import_distribution': {}
-        }
-        
-        # Price statistics
-        if 'Price_Numeric' in self.df.columns:
-            price_stats = self.df['Price_Numeric'].describe().to_dict()
-            stats['price_statistics'] = {
-                'min': price_stats.get('min', 0),
-                'max': price_stats.get('max', 0),
-                'mean': price_stats.get('mean', 0),
-                'median': self.df['Price_Numeric'].median()
-            }
-        
-        # Categories distribution
-        if 'Category' in self.df.columns:
-            category_counts = self.df['Category'].value_counts().to_dict()
-            stats['categories_distribution'] = category_counts
-        
-        # Dosage forms distribution
-        if 'Dosage_Form' in self.df.columns:
-            dosage_counts = self.df['Dosage_Form'].value_counts().to_dict()
-            stats['dosage_forms_distribution'] = dosage_counts
-        
-        # Local/Import distribution
-        if 'Local/Import' in self.df.columns:
-            origin_counts = self.df['Local/Import'].value_counts().to_dict()
-            stats['local_import_distribution'] = origin_counts
-        
-        return stats
+import pandas as pd
+import numpy as np
+import hashlib
+import logging
+import os
+from typing import List, Dict, Any, Optional, Union
+import re
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+if njit is not None:
+    @njit(cache=True)
+    def _find_any(corpus, offsets, needle):
+        """Substring-search every CSR-packed haystack for needle
+
+        corpus is one uint8 buffer holding all rows back to back; offsets
+        delimits each row. The compiled two-pointer scan avoids per-row
+        Python string dispatch entirely.
+        """
+        n = len(offsets) - 1
+        out = np.zeros(n, np.bool_)
+        m = needle.size
+        for row in range(n):
+            start = offsets[row]
+            end = offsets[row + 1] - m
+            for i in range(start, end + 1):
+                hit = True
+                for j in range(m):
+                    if corpus[i + j] != needle[j]:
+                        hit = False
+                        break
+                if hit:
+                    out[row] = True
+                    break
+        return out
+
+
+def _pack_csr(strings):
+    """Pack an array of strings into one uint8 buffer plus row offsets"""
+    encoded = [s.encode('utf-8') for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(chunk) for chunk in encoded])
+    buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    return buf, offsets
+
+# Explicit CSV schema: parse only the columns the processor uses and skip
+# dtype inference on the free-text columns
+CSV_COLUMNS = frozenset(
+    ['SN.', 'Trade_Name', 'Strenght/\nConc.', 'Dosage_Form',
+     'Quantity_of_Dosage_Form', 'Price', 'Generic_Name', 'Local/Import',
+     'Category', 'Indications_for_Use', 'Image_URL']
+    + [f'Side_Effect_{i}' for i in range(1, 10)]
+)
+CSV_DTYPES = {
+    'Trade_Name': 'string',
+    'Generic_Name': 'string',
+    'Indications_for_Use': 'string',
+    'Price': 'string',
+    'Category': 'category',
+    'Dosage_Form': 'category',
+    'Local/Import': 'category'
+}
+
+class MedicationProcessor:
+    """
+    Class for processing and managing medication data
+    """
+    
+    def __init__(self):
+        """Initialize the MedicationProcessor"""
+        self.df = None
+        self.categories = []
+        self.trade_name_index = {}
+        self.generic_name_index = {}
+        self._name_index = {}
+        self.category_index = {}
+        self._category_to_idxs = {}
+        self.name_automaton = None
+        self._search_blob = None
+        # Columnar (struct-of-arrays) record storage; per-medication dicts
+        # are materialized on demand by _row_to_dict
+        self._columns = {}
+        self._se_matrix = None
+        self._se_mask = None
+        self._trade_lc = None
+        self._generic_lc = None
+        self._cat_lc = None
+        self._ind_lc = None
+        self._price_num = None
+        self._stats_cache = {}
+        self._cat_bytes = self._cat_offsets = None
+        self._ind_bytes = self._ind_offsets = None
+        
+    def load_data(self, source: str, cache_path: Optional[str] = 'medications.feather') -> bool:
+        """
+        Load medication data from a CSV file or URL
+
+        Args:
+            source: Path or URL to the CSV file
+            cache_path: Optional local feather file used to skip re-parsing
+                the CSV on subsequent process starts
+
+        Returns:
+            bool: True if data was loaded successfully, False otherwise
+        """
+        try:
+            if cache_path:
+                # Key the cache file by source so a changed dataset URL is
+                # re-parsed instead of being shadowed by a stale cache
+                digest = hashlib.md5(source.encode('utf-8')).hexdigest()[:8]
+                root, ext = os.path.splitext(cache_path)
+                cache_path = f"{root}-{digest}{ext}"
+            
+            if cache_path and os.path.exists(cache_path):
+                # Feather loads are memory-mapped and skip CSV parsing entirely
+                logger.info(f"Loading medication data from cache {cache_path}")
+                self.df = pd.read_feather(cache_path)
+            else:
+                logger.info(f"Loading medication data from {source}")
+                # na_filter=False hands empty cells through as '' directly,
+                # skipping the NaN-detection pass and the fillna rewrite that
+                # _clean_data used to do afterwards
+                self.df = pd.read_csv(source,
+                                      usecols=lambda col: col.strip() in CSV_COLUMNS,
+                                      dtype=CSV_DTYPES,
+                                      keep_default_na=False, na_filter=False)
+
+                if cache_path:
+                    try:
+                        self.df.to_feather(cache_path)
+                    except Exception as cache_error:
+                        logger.warning(f"Could not write dataset cache: {cache_error}")
+            
+            # Clean the data
+            self._clean_data()
+            
+            # Create indexes for faster lookups
+            self._create_indexes()
+            
+            # Extract the columnar arrays that back medication records
+            self._create_record_arrays()
+            
+            # Statistics never change after load; compute them once here
+            self._stats_cache = self._compute_statistics()
+            
+            logger.info(f"Successfully loaded {len(self.df)} medications")
+            return True
+        except Exception as e:
+            logger.error(f"Error loading medication data: {str(e)}")
+            return False
+    
+    def _clean_data(self) -> None:
+        """Clean and preprocess the data"""
+        # Missing values arrive as '' straight from the reader
+        # (na_filter=False), so no fillna pass is needed
+        
+        # Clean column names (remove whitespace)
+        self.df.columns = [col.strip() for col in self.df.columns]
+        
+        # Ensure required columns exist
+        required_columns = ['SN.', 'Trade_Name', 'Generic_Name', 'Category', 'Price']
+        for col in required_columns:
+            if col not in self.df.columns:
+                logger.warning(f"Required column '{col}' not found in dataset")
+        
+        # Pull the numeric part out of the price first so values carrying a
+        # currency suffix or unit still parse instead of coercing to NaN;
+        # float32 halves the bytes scanned by the price-range filters
+        if 'Price' in self.df.columns:
+            numeric_part = self.df['Price'].astype(str).str.extract(r'([\d.]+)',
+                                                                    expand=False)
+            self.df['Price_Numeric'] = pd.to_numeric(numeric_part,
+                                                     errors='coerce').astype('float32')
+
+        # Use compact dtypes: low-cardinality columns become categoricals
+        # (integer-code comparisons, small memory footprint) and free-text
+        # columns become string dtype (Arrow-backed when pyarrow is installed)
+        for col in ['Category', 'Dosage_Form', 'Local/Import']:
+            if col in self.df.columns:
+                self.df[col] = self.df[col].astype('category')
+
+        for col in ['Trade_Name', 'Generic_Name', 'Indications_for_Use']:
+            if col in self.df.columns:
+                try:
+                    self.df[col] = self.df[col].astype('string[pyarrow]')
+                except ImportError:
+                    self.df[col] = self.df[col].astype('string')
+    
+    def _create_indexes(self) -> None:
+        """Create indexes for faster lookups"""
+        # Extract categories straight from the categorical's dictionary
+        if 'Category' in self.df.columns:
+            self.categories = sorted(self.df['Category'].cat.categories.tolist())
+            
+            # Create category index
+            for category in self.categories:
+                self.category_index[category.lower()] = category
+            
+            # Precompute row positions per category (pandas returns
+            # {category: ndarray of int positions} from C code) so category
+            # filters are a dict lookup instead of a full-table scan
+            self._category_to_idxs = self.df.groupby('Category', observed=True).indices
+        
+        # Create trade name index
+        if 'Trade_Name' in self.df.columns:
+            for idx, name in enumerate(self.df['Trade_Name']):
+                if pd.notna(name) and name:
+                    self.trade_name_index[name.lower()] = idx
+        
+        # Create generic name index
+        if 'Generic_Name' in self.df.columns:
+            for idx, name in enumerate(self.df['Generic_Name']):
+                if pd.notna(name) and name:
+                    self.generic_name_index[name.lower()] = idx
+        
+        # Merge both name indexes into one dict so lookups hash the name
+        # once; trade names win ties with generic names
+        self._name_index = {**self.generic_name_index, **self.trade_name_index}
+        
+        # Build a multi-pattern automaton over all names so consumers can
+        # find every mention in a question in a single linear scan
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for name, idx in self._name_index.items():
+                automaton.add_word(name, idx)
+            if len(automaton) > 0:
+                automaton.make_automaton()
+                self.name_automaton = automaton
+    
+    def _create_record_arrays(self) -> None:
+        """Extract the columnar arrays that back per-medication records
+
+        Keeping only contiguous arrays (struct-of-arrays) means scans touch a
+        handful of compact columns instead of thousands of Python dicts; the
+        dict form of a medication is materialized on demand by _row_to_dict.
+        """
+        n = len(self.df)
+
+        def column(name: str) -> np.ndarray:
+            """Fetch a column as a plain array, or empty strings if absent"""
+            if name in self.df.columns:
+                return self.df[name].to_numpy(dtype=object)
+            return np.full(n, '', dtype=object)
+
+        def lowercase(name: str) -> np.ndarray:
+            """Precompute a lowercase shadow array for case-insensitive scans"""
+            if name in self.df.columns:
+                return self.df[name].astype(str).str.lower().to_numpy(dtype=str)
+            return np.full(n, '', dtype=str)
+
+        self._columns = {
+            'SN': column('SN.'),
+            'Trade_Name': column('Trade_Name'),
+            'Strength': column('Strenght/\nConc.'),
+            'Dosage_Form': column('Dosage_Form'),
+            'Quantity_of_Dosage_Form': column('Quantity_of_Dosage_Form'),
+            'Price': column('Price'),
+            'Generic_Name': column('Generic_Name'),
+            'Local_Import': column('Local/Import'),
+            'Category': column('Category'),
+            'Indications_for_Use': column('Indications_for_Use'),
+            'Image_URL': column('Image_URL')
+        }
+        # Stack the side-effect columns into one n-by-k matrix with a
+        # precomputed non-empty mask; building a row's list becomes a single
+        # mask-and-gather instead of nine per-row column probes
+        se_cols = [f'Side_Effect_{i}' for i in range(1, 10)
+                   if f'Side_Effect_{i}' in self.df.columns]
+        if se_cols:
+            self._se_matrix = self.df[se_cols].to_numpy(dtype=object)
+            self._se_mask = (self._se_matrix != '') & pd.notna(self._se_matrix)
+        else:
+            self._se_matrix = np.empty((n, 0), dtype=object)
+            self._se_mask = np.zeros((n, 0), dtype=bool)
+
+        self._trade_lc = lowercase('Trade_Name')
+        self._generic_lc = lowercase('Generic_Name')
+        self._cat_lc = lowercase('Category')
+        self._ind_lc = lowercase('Indications_for_Use')
+
+        if 'Price_Numeric' in self.df.columns:
+            self._price_num = self.df['Price_Numeric'].to_numpy()
+        else:
+            self._price_num = np.full(n, np.nan, dtype='float32')
+
+        # CSR byte layout for the compiled condition scan (numba only)
+        if njit is not None:
+            self._cat_bytes, self._cat_offsets = _pack_csr(self._cat_lc)
+            self._ind_bytes, self._ind_offsets = _pack_csr(self._ind_lc)
+
+        # One concatenated lowercase blob per row backs the search filter;
+        # a single np.char.find over it replaces per-row substring checks
+        separator = np.full(n, '|', dtype=str)
+        blob = self._trade_lc
+        for part in (self._generic_lc, self._cat_lc, self._ind_lc):
+            blob = np.char.add(np.char.add(blob, separator), part)
+        self._search_blob = blob
+
+    def _rows_to_dicts(self, idxs: np.ndarray) -> List[Dict[str, Any]]:
+        """Materialize medication dicts for many rows in a column-major pass
+
+        Fancy indexing slices each backing array once at C level, so the
+        Python-level work per row is a zip step instead of one array lookup
+        per column.
+        """
+        records = [{'id': str(int(pos))} for pos in idxs]
+        for key, arr in self._columns.items():
+            for record, value in zip(records, arr[idxs]):
+                record[key] = value
+        se_rows = self._se_matrix[idxs]
+        se_mask = self._se_mask[idxs]
+        for i, record in enumerate(records):
+            record['Side_Effects'] = se_rows[i][se_mask[i]].tolist()
+        return records
+
+    def _row_to_dict(self, pos: int) -> Dict[str, Any]:
+        """Materialize the medication dict for a row position on demand"""
+        medication = {'id': str(pos)}
+        for key, arr in self._columns.items():
+            medication[key] = arr[pos]
+        medication['Side_Effects'] = self._se_matrix[pos][self._se_mask[pos]].tolist()
+        return medication
+    
+    def is_data_loaded(self) -> bool:
+        """Check if data is loaded"""
+        return self.df is not None and not self.df.empty
+    
+    def get_medication_count(self) -> int:
+        """Get the number of medications"""
+        return len(self.df) if self.df is not None else 0
+    
+    def get_categories(self) -> List[str]:
+        """Get all medication categories"""
+        return self.categories
+    
+    def get_medications(self, search: str = '', category: str = '', limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get medications, optionally filtered by search term or category
+        
+        Args:
+            search: Search term to filter medications
+            category: Category to filter medications
+            limit: Maximum number of medications to return
+            
+        Returns:
+            List of medication dictionaries
+        """
+        # Single pipeline: category filtering is a lookup into the
+        # precomputed position index, the search term is matched against the
+        # lowercase blob in one C pass, and the limit is applied to row
+        # positions before anything is materialized
+        if category:
+            idxs = self._category_to_idxs.get(category, np.array([], dtype=np.int64))
+            if search:
+                mask = np.char.find(self._search_blob, search.lower()) >= 0
+                idxs = idxs[mask[idxs]]
+        elif search:
+            idxs = np.flatnonzero(np.char.find(self._search_blob, search.lower()) >= 0)
+        else:
+            idxs = np.arange(len(self.df))
+        
+        if limit:
+            idxs = idxs[:limit]
+        
+        return self._rows_to_dicts(idxs)
+    
+    def get_medication_by_id(self, medication_id: Union[int, str]) -> Optional[Dict[str, Any]]:
+        """
+        Get a medication by its ID
+
+        Args:
+            medication_id: Row position of the medication; internal callers
+                pass the int directly, the API route passes its str form
+
+        Returns:
+            Medication dictionary or None if not found
+        """
+        try:
+            pos = int(medication_id)
+        except (TypeError, ValueError):
+            return None
+
+        if self.df is not None and 0 <= pos < len(self.df):
+            return self._row_to_dict(pos)
+        return None
+    
+    def get_medication_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a medication by its trade name or generic name
+        
+        Args:
+            name: Trade name or generic name of the medication
+            
+        Returns:
+            Medication dictionary or None if not found
+        """
+        # One lookup in the merged index covers both trade and generic names
+        idx = self._name_index.get(name.lower())
+        if idx is not None:
+            return self._row_to_dict(idx)
+        return None
+    
+    def find_by_condition(self, condition: str) -> List[Dict[str, Any]]:
+        """
+        Find medications whose category or indications mention a condition
+
+        Args:
+            condition: Condition or category fragment, case-insensitive
+
+        Returns:
+            List of medication dictionaries
+        """
+        if self.df is None:
+            return []
+
+        condition = condition.lower()
+        if njit is not None and self._cat_bytes is not None:
+            needle = np.frombuffer(condition.encode('utf-8'), dtype=np.uint8)
+            mask = (_find_any(self._cat_bytes, self._cat_offsets, needle)
+                    | _find_any(self._ind_bytes, self._ind_offsets, needle))
+        else:
+            mask = ((np.char.find(self._cat_lc, condition) >= 0)
+                    | (np.char.find(self._ind_lc, condition) >= 0))
+        return self._rows_to_dicts(np.flatnonzero(mask))
+
+    def advanced_search(self, criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Perform an advanced search on medications
+        
+        Args:
+            criteria: Dictionary of search criteria
+            
+        Returns:
+            List of medication dictionaries matching the criteria
+        """
+        if self.df is None:
+            return []
+        
+        # AND every active criterion into one boolean mask over the
+        # precomputed arrays; no intermediate DataFrame is allocated
+        mask = np.ones(len(self.df), dtype=bool)
+        
+        if criteria.get('trade_name'):
+            mask &= np.char.find(self._trade_lc, criteria['trade_name'].lower()) >= 0
+        
+        if criteria.get('generic_name'):
+            mask &= np.char.find(self._generic_lc, criteria['generic_name'].lower()) >= 0
+        
+        if criteria.get('category'):
+            mask &= (self.df['Category'] == criteria['category']).to_numpy()
+        
+        if criteria.get('min_price') is not None:
+            mask &= self._price_num >= criteria['min_price']
+        
+        if criteria.get('max_price') is not None:
+            mask &= self._price_num <= criteria['max_price']
+        
+        if criteria.get('indication'):
+            mask &= np.char.find(self._ind_lc, criteria['indication'].lower()) >= 0
+        
+        # Convert results to list of dictionaries
+        return self._rows_to_dicts(np.flatnonzero(mask))
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get statistics about the medication dataset
+        
+        Returns:
+            Dictionary of statistics, precomputed at load time
+        """
+        return self._stats_cache
+    
+    def _compute_statistics(self) -> Dict[str, Any]:
+        """Compute the dataset statistics served by get_statistics
+        
+        The dataset is immutable after load_data, so this runs once and the
+        result is cached; get_statistics becomes a dict return.
+        """
+        if self.df is None:
+            return {}
+        
+        stats = {
+            'total_medications': len(self.df),
+            'total_categories': len(self.categories),
+            'price_statistics': {},
+            'categories_distribution': {},
+            'dosage_forms_distribution': {},
+            'local_import_distribution': {}
+        }
+        
+        # Price statistics
+        if 'Price_Numeric' in self.df.columns:
+            price_stats = self.df['Price_Numeric'].describe().to_dict()
+            # Cast to plain floats: the column is float32 and np.float32
+            # scalars are not JSON-serializable
+            stats['price_statistics'] = {
+                'min': float(price_stats.get('min', 0)),
+                'max': float(price_stats.get('max', 0)),
+                'mean': float(price_stats.get('mean', 0)),
+                'median': float(self.df['Price_Numeric'].median())
+            }
+        
+        # Categories distribution
+        if 'Category' in self.df.columns:
+            category_counts = self.df['Category'].value_counts().to_dict()
+            stats['categories_distribution'] = category_counts
+        
+        # Dosage forms distribution
+        if 'Dosage_Form' in self.df.columns:
+            dosage_counts = self.df['Dosage_Form'].value_counts().to_dict()
+            stats['dosage_forms_distribution'] = dosage_counts
+        
+        # Local/Import distribution
+        if 'Local/Import' in self.df.columns:
+            origin_counts = self.df['Local/Import'].value_counts().to_dict()
+            stats['local_import_distribution'] = origin_counts
+        
+        return stats
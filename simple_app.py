@@ -1,198 +1,463 @@
-from flask import Flask, request, jsonify
-import json
-import os
-from flask_cors import CORS
-
-app = Flask(__name__)
-CORS(app)  # Enable CORS for all routes
-
-# Global variables to store medications and categories
-medications = []
-categories = []
-
-def load_sample_data():
-    """Load some sample medication data"""
-    global medications, categories
-    
-    # Sample medications data
-    medications = [
-        {
-            "id": "1",
-            "Trade_Name": "Panadol",
-            "Generic_Name": "Paracetamol",
-            "Category": "Pain Relief",
-            "Indications_for_Use": "For the relief of mild to moderate pain and fever",
-            "Price": "$5.99",
-            "Side_Effects": ["Nausea", "Stomach pain", "Rash", "Headache"]
-        },
-        {
-            "id": "2",
-            "Trade_Name": "Zyrtec",
-            "Generic_Name": "Cetirizine",
-            "Category": "Allergy",
-            "Indications_for_Use": "For the relief of symptoms associated with seasonal allergies",
-            "Price": "$12.99",
-            "Side_Effects": ["Drowsiness", "Dry mouth", "Fatigue"]
-        },
-        {
-            "id": "3",
-            "Trade_Name": "Lipitor",
-            "Generic_Name": "Atorvastatin",
-            "Category": "Cholesterol",
-            "Indications_for_Use": "For lowering blood cholesterol and reducing risk of heart disease",
-            "Price": "$45.99",
-            "Side_Effects": ["Muscle pain", "Digestive problems", "Liver enzyme abnormalities"]
-        },
-        {
-            "id": "4",
-            "Trade_Name": "Augmentin",
-            "Generic_Name": "Amoxicillin/Clavulanate",
-            "Category": "Antibiotic",
-            "Indications_for_Use": "For treating bacterial infections",
-            "Price": "$25.50",
-            "Side_Effects": ["Diarrhea", "Nausea", "Vomiting", "Rash", "Headache"]
-        },
-        {
-            "id": "5",
-            "Trade_Name": "Ventolin",
-            "Generic_Name": "Albuterol",
-            "Category": "Respiratory",
-            "Indications_for_Use": "For relief of bronchospasm in asthma and COPD",
-            "Price": "$30.75",
-            "Side_Effects": ["Nervousness", "Shaking", "Headache", "Throat irritation"]
-        }
-    ]
-    
-    # Extract categories
-    categories = sorted(list(set(med["Category"] for med in medications)))
-    
-    print(f"Loaded {len(medications)} sample medications")
-    print(f"Categories: {categories}")
-
-@app.route('/', methods=['GET'])
-def home():
-    return '''
-    <h1>Welcome to MedAI Flask API </h1>
-    <p>Try the following endpoints:</p>
-    <ul>
-        <li>/api/health</li>
-        <li>/api/medications</li>
-        <li>/api/categories</li>
-        <li>/api/answer (POST)</li>
-    </ul>
-    '''
-
-
-
-
-@app.route('/api/health', methods=['GET'])
-def health_check():
-    """Health check endpoint to verify the API is running"""
-    return jsonify({
-        "status": "healthy", 
-        "medications_count": len(medications),
-        "categories_count": len(categories)
-    })
-
-@app.route('/api/medications', methods=['GET'])
-def get_medications():
-    """Return a list of medications, optionally filtered by search term or category"""
-    search = request.args.get('search', '').lower()
-    category = request.args.get('category', '')
-    
-    # Filter medications
-    filtered_meds = medications
-    
-    if category:
-        filtered_meds = [med for med in filtered_meds if med.get('Category') == category]
-    
-    if search:
-        filtered_meds = [
-            med for med in filtered_meds if 
-            search in str(med.get('Trade_Name', '')).lower() or
-            search in str(med.get('Generic_Name', '')).lower() or
-            search in str(med.get('Category', '')).lower() or
-            search in str(med.get('Indications_for_Use', '')).lower()
-        ]
-    
-    return jsonify(filtered_meds)
-
-@app.route('/api/categories', methods=['GET'])
-def get_categories():
-    """Return a list of all medication categories"""
-    return jsonify(categories)
-
-@app.route('/api/answer', methods=['POST'])
-def answer_question():
-    """Answer a question about medications"""
-    data = request.json
-    if not data or 'question' not in data:
-        return jsonify({"error": "No question provided"}), 400
-    
-    question = data.get('question', '').lower()
-    
-    # Simple question answering logic
-    for med in medications:
-        trade_name = med.get('Trade_Name', '').lower()
-        generic_name = med.get('Generic_Name', '').lower()
-        
-        if trade_name in question or generic_name in question:
-            # Generate a response based on the medication
-            if 'side effect' in question or 'adverse' in question:
-                side_effects = med.get('Side_Effects', [])
-                
-                if side_effects:
-                    response = f"**Side Effects of {med['Trade_Name']}:**\n\n"
-                    response += '\n'.join([f"• {effect}" for effect in side_effects])
-                    response += "\n\nIf you experience severe side effects, contact your healthcare provider immediately."
-                else:
-                    response = f"No specific side effects are listed for {med['Trade_Name']}."
-                
-                return jsonify({"answer": response})
-            
-            if 'price' in question or 'cost' in question or 'how much' in question:
-                return jsonify({"answer": f"**{med['Trade_Name']}** is priced at {med.get('Price', 'N/A')}.\n\nPlease note that prices may vary by location and pharmacy."})
-            
-            if 'use' in question or 'for' in question or 'treat' in question or 'indication' in question:
-                return jsonify({"answer": f"**{med['Trade_Name']}** ({med['Generic_Name']}) is used for:\n\n{med.get('Indications_for_Use', 'N/A')}"})
-            
-            # General information
-            response = f"**{med['Trade_Name']}** ({med['Generic_Name']})\n\n"
-            response += f"**Category:** {med.get('Category', 'N/A')}\n\n"
-            response += f"**Used for:** {med.get('Indications_for_Use', 'N/A')}\n\n"
-            response += f"**Price:** {med.get('Price', 'N/A')}\n\n"
-            
-            if med.get('Side_Effects'):
-                response += "**Common Side Effects:**\n"
-                for effect in med.get('Side_Effects', [])[:5]:
-                    response += f"• {effect}\n"
-            
-            return jsonify({"answer": response})
-    
-    # Check for category queries
-    if 'medications for' in question or 'drugs for' in question or 'medicine for' in question:
-        for category in categories:
-            if category.lower() in question:
-                category_meds = [med for med in medications if med.get('Category') == category]
-                
-                if category_meds:
-                    response = f"Here are medications for {category}:\n\n"
-                    
-                    for med in category_meds:
-                        response += f"**{med['Trade_Name']}** ({med['Generic_Name']})\n"
-                        response += f"• {med['Indications_for_Use']}\n"
-                        response += f"• Price: {med['Price']}\n\n"
-                    
-                    return jsonify({"answer": response})
-    
-    # Default response
-    return jsonify({
-        "answer": "Thank you for your question. Based on our medication database, I don't have specific information about that query.\n\nYou can ask about specific medications by name, their side effects, prices, or uses. You can also ask about medications for specific conditions.\n\nFor example, try asking:\n• \"What is Panadol used for?\"\n• \"What are the side effects of Augmentin?\"\n• \"How much does Lipitor cost?\"\n• \"What medications are available for allergies?\""
-    })
-
-if __name__ == '__main__':
-    # Load sample data
-    load_sample_data()
-    
-    # Run the app
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+from flask import Flask, request, jsonify, Response
+import json
+import mmap
+import os
+import re
+from functools import lru_cache
+from flask_cors import CORS
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _find_matches(corpus, offsets, needle):
+        """Substring-search every packed search blob for needle
+
+        corpus holds all blobs back to back as uint8 with offsets marking
+        the boundaries; the compiled scan replaces per-row Python string
+        work when the catalog grows large.
+        """
+        n = offsets.size - 1
+        out = np.zeros(n, np.bool_)
+        m = needle.size
+        for row in range(n):
+            start = offsets[row]
+            end = offsets[row + 1] - m
+            for i in range(start, end + 1):
+                hit = True
+                for j in range(m):
+                    if corpus[i + j] != needle[j]:
+                        hit = False
+                        break
+                if hit:
+                    out[row] = True
+                    break
+        return out
+
+
+def _dumps(obj):
+    """Serialize to JSON bytes, through orjson's C encoder when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+app = Flask(__name__)
+CORS(app)  # Enable CORS for all routes
+
+if orjson is not None:
+    from flask.json.provider import JSONProvider
+
+    class ORJSONProvider(JSONProvider):
+        """Flask JSON provider backed by orjson's C encoder/decoder"""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode('utf-8')
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    # Routes every jsonify / request.json call through orjson
+    app.json = ORJSONProvider(app)
+
+# Global variables to store medications and categories
+medications = []
+categories = []
+
+# Derived lookup structures built once in load_sample_data: a lowercase
+# search blob per medication (parallel to `medications` so it never leaks
+# into responses) and a category -> row positions index
+search_blobs = []
+category_index = {}
+
+# Inverted index: token -> sorted row positions. Whole-word searches
+# resolve in O(1) per token regardless of catalog size; partial terms
+# fall back to the blob scan
+token_index = {}
+
+# Name lookup for the answer endpoint: lowercase trade/generic name ->
+# medication, plus an automaton (or small fallback list) for names that
+# span several tokens
+name_to_med = {}
+multiword_names = []
+name_automaton = None
+
+# Packed byte corpus of the search blobs for the compiled scan (numba only)
+search_corpus = None
+search_offsets = None
+
+# Intent keywords compiled once into a single alternation: one scan of the
+# question collects every matched intent via the group names. (A
+# Hyperscan/RE2 database would run the same patterns with SIMD; the stdlib
+# engine keeps this dependency-free.)
+INTENT_REGEX = re.compile(
+    r'(?P<side_effects>side effect|adverse)'
+    r'|(?P<price>price|cost|how much)'
+    r'|(?P<usage>use|for|treat|indication)'
+)
+
+# Static payloads, built once at import: the landing page and the
+# default answer returned when no medication or category matches
+HOME_HTML = '''
+    <h1>Welcome to MedAI Flask API </h1>
+    <p>Try the following endpoints:</p>
+    <ul>
+        <li>/api/health</li>
+        <li>/api/medications</li>
+        <li>/api/categories</li>
+        <li>/api/answer (POST)</li>
+    </ul>
+    '''
+DEFAULT_ANSWER_JSON = _dumps({
+    "answer": "Thank you for your question. Based on our medication database, I don't have specific information about that query.\n\nYou can ask about specific medications by name, their side effects, prices, or uses. You can also ask about medications for specific conditions.\n\nFor example, try asking:\n• \"What is Panadol used for?\"\n• \"What are the side effects of Augmentin?\"\n• \"How much does Lipitor cost?\"\n• \"What medications are available for allergies?\""
+})
+
+# Upper bound on /api/answer request bodies; anything larger is rejected
+# before parsing
+MAX_QUESTION_BYTES = 4096
+
+# Responses whose payload never changes after load, serialized once
+CATEGORIES_JSON = b'[]'
+MEDS_JSON_ALL = b'[]'
+
+# Canned per-medication answer payloads keyed by medication id
+med_answers = {}
+
+# Category matching for "medications for X" questions: one alternation
+# over all category names plus a lowercase -> original lookup
+CATEGORY_RE = None
+CATEGORY_LOOKUP = {}
+
+# Serialized "medications for X" answer per category
+CATEGORY_ANSWERS = {}
+
+
+def _build_category_answer(category, meds):
+    """Serialize the canned answer listing a category's medications"""
+    response = f"Here are medications for {category}:\n\n"
+    for med in meds:
+        response += f"**{med['Trade_Name']}** ({med['Generic_Name']})\n"
+        response += f"• {med['Indications_for_Use']}\n"
+        response += f"• Price: {med['Price']}\n\n"
+    return _dumps({"answer": response})
+
+
+def _precompute_answers(med):
+    """Build the four canned answer payloads for one medication"""
+    side_effects = med.get('Side_Effects', [])
+    if side_effects:
+        response = f"**Side Effects of {med['Trade_Name']}:**\n\n"
+        response += '\n'.join([f"• {effect}" for effect in side_effects])
+        response += "\n\nIf you experience severe side effects, contact your healthcare provider immediately."
+    else:
+        response = f"No specific side effects are listed for {med['Trade_Name']}."
+    answers = {'side_effects': _dumps({"answer": response})}
+    
+    answers['price'] = _dumps({"answer": f"**{med['Trade_Name']}** is priced at {med.get('Price', 'N/A')}.\n\nPlease note that prices may vary by location and pharmacy."})
+    
+    answers['usage'] = _dumps({"answer": f"**{med['Trade_Name']}** ({med['Generic_Name']}) is used for:\n\n{med.get('Indications_for_Use', 'N/A')}"})
+    
+    response = f"**{med['Trade_Name']}** ({med['Generic_Name']})\n\n"
+    response += f"**Category:** {med.get('Category', 'N/A')}\n\n"
+    response += f"**Used for:** {med.get('Indications_for_Use', 'N/A')}\n\n"
+    response += f"**Price:** {med.get('Price', 'N/A')}\n\n"
+    if side_effects:
+        response += "**Common Side Effects:**\n"
+        for effect in side_effects[:5]:
+            response += f"• {effect}\n"
+    answers['general'] = _dumps({"answer": response})
+    
+    return answers
+
+def load_sample_data():
+    """Load some sample medication data"""
+    global medications, categories, search_blobs, category_index, token_index
+    global name_to_med, multiword_names, name_automaton
+    global search_corpus, search_offsets
+    global CATEGORIES_JSON, MEDS_JSON_ALL, med_answers
+    global CATEGORY_RE, CATEGORY_LOOKUP, CATEGORY_ANSWERS
+    
+    # When MEDICATIONS_FILE points at a JSON array (written once to e.g.
+    # /dev/shm before gunicorn forks), map it read-only so every worker
+    # shares the same physical pages instead of holding its own copy
+    data_path = os.environ.get('MEDICATIONS_FILE')
+    if data_path and os.path.exists(data_path):
+        with open(data_path, 'rb') as data_file:
+            mapped = mmap.mmap(data_file.fileno(), 0, prot=mmap.PROT_READ)
+            try:
+                raw = mapped[:]
+            finally:
+                mapped.close()
+        medications = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    else:
+        # Sample medications data
+        medications = [
+            {
+                "id": "1",
+                "Trade_Name": "Panadol",
+                "Generic_Name": "Paracetamol",
+                "Category": "Pain Relief",
+                "Indications_for_Use": "For the relief of mild to moderate pain and fever",
+                "Price": "$5.99",
+                "Side_Effects": ["Nausea", "Stomach pain", "Rash", "Headache"]
+            },
+            {
+                "id": "2",
+                "Trade_Name": "Zyrtec",
+                "Generic_Name": "Cetirizine",
+                "Category": "Allergy",
+                "Indications_for_Use": "For the relief of symptoms associated with seasonal allergies",
+                "Price": "$12.99",
+                "Side_Effects": ["Drowsiness", "Dry mouth", "Fatigue"]
+            },
+            {
+                "id": "3",
+                "Trade_Name": "Lipitor",
+                "Generic_Name": "Atorvastatin",
+                "Category": "Cholesterol",
+                "Indications_for_Use": "For lowering blood cholesterol and reducing risk of heart disease",
+                "Price": "$45.99",
+                "Side_Effects": ["Muscle pain", "Digestive problems", "Liver enzyme abnormalities"]
+            },
+            {
+                "id": "4",
+                "Trade_Name": "Augmentin",
+                "Generic_Name": "Amoxicillin/Clavulanate",
+                "Category": "Antibiotic",
+                "Indications_for_Use": "For treating bacterial infections",
+                "Price": "$25.50",
+                "Side_Effects": ["Diarrhea", "Nausea", "Vomiting", "Rash", "Headache"]
+            },
+            {
+                "id": "5",
+                "Trade_Name": "Ventolin",
+                "Generic_Name": "Albuterol",
+                "Category": "Respiratory",
+                "Indications_for_Use": "For relief of bronchospasm in asthma and COPD",
+                "Price": "$30.75",
+                "Side_Effects": ["Nervousness", "Shaking", "Headache", "Throat irritation"]
+            }
+        ]
+    
+    # Extract categories
+    categories = sorted(list(set(med["Category"] for med in medications)))
+    
+    # Lowercase every searchable field once here instead of on every request
+    search_blobs = [
+        ' '.join(str(med.get(key, '')) for key in
+                 ('Trade_Name', 'Generic_Name', 'Category',
+                  'Indications_for_Use')).lower()
+        for med in medications
+    ]
+    category_index = {
+        category: [i for i, med in enumerate(medications)
+                   if med.get('Category') == category]
+        for category in categories
+    }
+    CATEGORY_LOOKUP = {category.lower(): category for category in categories}
+    CATEGORY_RE = re.compile(
+        r'\b(' + '|'.join(re.escape(name) for name in CATEGORY_LOOKUP) + r')\b'
+    ) if categories else None
+    CATEGORY_ANSWERS = {
+        category: _build_category_answer(category,
+                                         [medications[i] for i in idxs])
+        for category, idxs in category_index.items() if idxs
+    }
+    
+    token_index = {}
+    for i, blob in enumerate(search_blobs):
+        for token in set(re.findall(r'\w+', blob)):
+            token_index.setdefault(token, []).append(i)
+    
+    if njit is not None:
+        encoded = [blob.encode('utf-8') for blob in search_blobs]
+        search_offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        search_offsets[1:] = np.cumsum([len(chunk) for chunk in encoded])
+        search_corpus = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    
+    name_to_med = {}
+    for med in medications:
+        for key in ('Trade_Name', 'Generic_Name'):
+            name = str(med.get(key, '')).lower()
+            if name:
+                name_to_med[name] = med
+    multiword_names = [(name, med) for name, med in name_to_med.items()
+                       if not name.isalnum()]
+    
+    if ahocorasick is not None:
+        name_automaton = ahocorasick.Automaton()
+        for name, med in name_to_med.items():
+            name_automaton.add_word(name, (len(name), med))
+        name_automaton.make_automaton()
+    else:
+        name_automaton = None
+    
+    # Serialize the static responses once; their handlers just hand the
+    # cached bytes back
+    CATEGORIES_JSON = _dumps(categories)
+    MEDS_JSON_ALL = _dumps(medications)
+    med_answers = {med['id']: _precompute_answers(med) for med in medications}
+    
+    # Cached answers are derived from the data, so reloading stales them
+    _compute_answer.cache_clear()
+    
+    print(f"Loaded {len(medications)} sample medications")
+    print(f"Categories: {categories}")
+
+@app.route('/', methods=['GET'])
+def home():
+    return Response(HOME_HTML, mimetype='text/html')
+
+
+
+
+@app.route('/api/health', methods=['GET'])
+def health_check():
+    """Health check endpoint to verify the API is running"""
+    return jsonify({
+        "status": "healthy", 
+        "medications_count": len(medications),
+        "categories_count": len(categories)
+    })
+
+@app.route('/api/medications', methods=['GET'])
+def get_medications():
+    """Return a list of medications, optionally filtered by search term or category"""
+    search = request.args.get('search', '').lower()
+    category = request.args.get('category', '')
+    
+    # The unfiltered listing is pre-serialized
+    if not search and not category:
+        return Response(MEDS_JSON_ALL, mimetype='application/json')
+    
+    # Filter medications: the category filter is an index lookup and the
+    # search filter is one substring test per row against the precomputed
+    # lowercase blob
+    if category:
+        idxs = category_index.get(category, [])
+    else:
+        idxs = range(len(medications))
+    
+    if search:
+        hits = token_index.get(search)
+        if hits is not None:
+            # Whole-word query: intersect with the posting list
+            hit_set = set(hits)
+            idxs = [i for i in idxs if i in hit_set]
+        elif njit is not None and search_corpus is not None:
+            # Partial term: compiled scan over the packed byte corpus
+            needle = np.frombuffer(search.encode('utf-8'), dtype=np.uint8)
+            mask = _find_matches(search_corpus, search_offsets, needle)
+            idxs = [i for i in idxs if mask[i]]
+        else:
+            # Partial term: substring scan over the precomputed blobs
+            idxs = [i for i in idxs if search in search_blobs[i]]
+    
+    return jsonify([medications[i] for i in idxs])
+
+@app.route('/api/categories', methods=['GET'])
+def get_categories():
+    """Return a list of all medication categories"""
+    return Response(CATEGORIES_JSON, mimetype='application/json')
+
+@lru_cache(maxsize=4096)
+def _compute_answer(question):
+    """Compute the serialized answer payload for a normalized question
+    
+    Memoized: the medication set is static, so a repeated question returns
+    its cached bytes without re-running any matching logic.
+    """
+    # Simple question answering logic: find a mentioned medication with a
+    # single automaton pass over the question; all trade and generic names
+    # are matched simultaneously and the longest hit wins
+    med = None
+    if name_automaton is not None:
+        longest = 0
+        for _, (length, candidate) in name_automaton.iter(question):
+            if length > longest:
+                longest = length
+                med = candidate
+    else:
+        # Fallback without pyahocorasick: token lookups for single-word
+        # names plus a substring pass over the few multi-word ones
+        for token in re.findall(r'\w+', question):
+            if token in name_to_med:
+                med = name_to_med[token]
+                break
+        if med is None:
+            for name, candidate in multiword_names:
+                if name in question:
+                    med = candidate
+                    break
+    
+    if med is not None:
+        # One regex pass replaces the chain of per-keyword substring
+        # tests, with the branch order preserving the original priority;
+        # every answer payload was built at load time
+        intents = {m.lastgroup for m in INTENT_REGEX.finditer(question)}
+        answers = med_answers[med['id']]
+        
+        if 'side_effects' in intents:
+            return answers['side_effects']
+        
+        if 'price' in intents:
+            return answers['price']
+        
+        if 'usage' in intents:
+            return answers['usage']
+        
+        # General information
+        return answers['general']
+    
+    # Check for category queries: one regex pass finds the category and
+    # the precomputed index supplies its medications
+    if 'medications for' in question or 'drugs for' in question or 'medicine for' in question:
+        match = CATEGORY_RE.search(question) if CATEGORY_RE is not None else None
+        if match:
+            answer = CATEGORY_ANSWERS.get(CATEGORY_LOOKUP[match.group(1)])
+            if answer is not None:
+                return answer
+    
+    # Default response, serialized once at import
+    return DEFAULT_ANSWER_JSON
+
+@app.route('/api/answer', methods=['POST'])
+def answer_question():
+    """Answer a question about medications"""
+    # Read the body once without caching a copy on the request object,
+    # cap its size, and parse through orjson when available
+    raw = request.get_data(cache=False)
+    if len(raw) > MAX_QUESTION_BYTES:
+        return jsonify({"error": "Question too large"}), 413
+    
+    try:
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except ValueError:
+        data = None
+    
+    if not isinstance(data, dict) or 'question' not in data:
+        return jsonify({"error": "No question provided"}), 400
+    
+    # Normalize whitespace and case so trivially different phrasings of
+    # the same question share a cache entry
+    question = re.sub(r'\s+', ' ', data.get('question', '').lower().strip())
+    
+    return Response(_compute_answer(question), mimetype='application/json')
+
+# Populate the module-level data at import time so every WSGI worker
+# (gunicorn workers import this module after forking) starts with the
+# globals filled
+load_sample_data()
\ No newline at end of file
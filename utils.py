@@ -1,43 +1,55 @@
-import logging
-import os
-import sys
-from logging.handlers import RotatingFileHandler
-
-def setup_logging():
-    """Set up logging configuration"""
-    # Create logs directory if it doesn't exist
-    if not os.path.exists('logs'):
-        os.makedirs('logs')
-    
-    # Configure logging
-    log_level = os.environ.get('LOG_LEVEL', 'INFO').upper()
-    
-    # Configure root logger
-    logger = logging.getLogger()
-    logger.setLevel(log_level)
-    
-    # Clear existing handlers
-    logger.handlers = []
-    
-    # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(log_level)
-    console_format = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    console_handler.setFormatter(console_format)
-    logger.addHandler(console_handler)
-    
-    # Create file handler
-    file_handler = RotatingFileHandler('logs/app.log', maxBytes=10485760, backupCount=5)
-    file_handler.setLevel(log_level)
-    file_format = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    file_handler.setFormatter(file_format)
-    logger.addHandler(file_handler)
-    
-    # Create error file handler
-    error_handler = RotatingFileHandler('logs/error.log', maxBytes=10485760, backupCount=5)
-    error_handler.setLevel(logging.ERROR)
-    error_format = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    error_handler.setFormatter(error_format)
-    logger.addHandler(error_handler)
-    
-    return logger
+import logging
+import os
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+def setup_logging():
+    """Set up logging configuration"""
+    # Create logs directory if it doesn't exist (exist_ok avoids the
+    # stat + race between parallel workers booting at once)
+    os.makedirs('logs', exist_ok=True)
+    
+    # Configure logging
+    log_level = os.environ.get('LOG_LEVEL', 'INFO').upper()
+    
+    # Configure root logger
+    logger = logging.getLogger()
+    logger.setLevel(log_level)
+    
+    # Clear existing handlers (and stop the listener from a previous call)
+    previous_listener = getattr(logger, 'queue_listener', None)
+    if previous_listener is not None:
+        previous_listener.stop()
+    logger.handlers = []
+    
+    # All three handlers share one Formatter instance
+    log_format = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
+    # Create console handler
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(log_level)
+    console_handler.setFormatter(log_format)
+    logger.addHandler(console_handler)
+    
+    # Create file handler
+    file_handler = RotatingFileHandler('logs/app.log', maxBytes=10485760, backupCount=5)
+    file_handler.setLevel(log_level)
+    file_handler.setFormatter(log_format)
+    
+    # Create error file handler
+    error_handler = RotatingFileHandler('logs/error.log', maxBytes=10485760, backupCount=5)
+    error_handler.setLevel(logging.ERROR)
+    error_handler.setFormatter(log_format)
+    
+    # File writes (and rotation) happen on a background listener thread;
+    # the request path only enqueues the record
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, file_handler, error_handler,
+                             respect_handler_level=True)
+    listener.start()
+    # Keep a reference so callers can stop the listener at shutdown
+    logger.queue_listener = listener
+    
+    return logger
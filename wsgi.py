@@ -0,0 +1,16 @@
+"""WSGI entry point for the sample API
+
+The Werkzeug dev server is single-threaded and not meant for production
+traffic. Serve this module with gunicorn instead; worker count and the
+keep-alive worker class come from gunicorn.conf.py:
+
+    gunicorn wsgi:app
+
+simple_app loads its data at import time, so each worker arrives with the
+medication globals already populated.
+"""
+from simple_app import app
+
+if __name__ == '__main__':
+    # Local fallback only; use gunicorn as above for real serving
+    app.run(host='0.0.0.0', port=5000)